@@ -44,7 +44,7 @@ echo.
 echo  [..] Installing required packages...
 
 python -m pip install --upgrade pip --quiet
-python -m pip install playwright requests yt-dlp --quiet
+python -m pip install playwright requests yt-dlp boto3 --quiet
 
 echo  [..] Installing browser (one-time download ~150MB)...
 python -m playwright install chromium
@@ -60,7 +60,7 @@ echo "  [OK] Node.js $(node --version)"
 # ── Python packages ───────────────────────────────────────────────────────────
 echo "  [..] Installing Python packages..."
 python3 -m pip install --upgrade pip --quiet --break-system-packages 2>/dev/null || python3 -m pip install --upgrade pip --quiet
-python3 -m pip install playwright requests yt-dlp --quiet --break-system-packages 2>/dev/null || python3 -m pip install playwright requests yt-dlp --quiet
+python3 -m pip install playwright requests yt-dlp boto3 --quiet --break-system-packages 2>/dev/null || python3 -m pip install playwright requests yt-dlp boto3 --quiet
 echo "  [OK] Python packages"
 
 # ── Playwright browser ────────────────────────────────────────────────────────
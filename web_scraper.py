@@ -4,13 +4,17 @@ Just double-click run.bat to start!
 """
 
 import asyncio
+import hashlib
+import importlib
 import json
 import os
 import re
 import shutil
 import subprocess
 import sys
+import tarfile
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
@@ -23,6 +27,15 @@ BASE_DIR    = Path(__file__).parent / "scraper_output"
 COOKIE_FILE = Path(__file__).parent / "screener_session.json"
 MONTHS_BACK = 18
 
+# Export / sync (python web_scraper.py export | sync)
+EXPORT_DIR     = Path(__file__).parent / "scraper_export"
+MANIFEST_FILE  = EXPORT_DIR / "manifest.json"
+SEGMENT_MAX_MB = 512      # hard cap, except a single file larger than this gets its own segment
+S3_ENDPOINT    = os.environ.get("SCRAPER_S3_ENDPOINT", "http://localhost:9000")   # MinIO default
+S3_BUCKET      = os.environ.get("SCRAPER_S3_BUCKET", "screener-archive")
+S3_PREFIX      = os.environ.get("SCRAPER_S3_PREFIX", "archive")
+SYNC_WORKERS   = 4
+
 MONTH_MAP = {
     "jan":1,"feb":2,"mar":3,"apr":4,"may":5,"jun":6,
     "jul":7,"aug":8,"sep":9,"oct":10,"nov":11,"dec":12
@@ -596,6 +609,216 @@ async def scrape_ticker(ticker: str, context):
         await page.close()
 
 
+# ─── EXPORT: pack scraper_output into append-only tar segments ───────────────
+def load_manifest() -> dict:
+    if not MANIFEST_FILE.exists():
+        return {"segments": [], "files": {}}
+    return json.loads(MANIFEST_FILE.read_text())
+
+def save_manifest(manifest: dict):
+    # Write-then-rename so a crash never leaves a half-written manifest
+    tmp = MANIFEST_FILE.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(manifest, indent=2))
+    os.replace(tmp, MANIFEST_FILE)
+
+def file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def find_new_files(manifest: dict) -> list:
+    """Files under BASE_DIR that are not in the manifest yet, or changed since."""
+    known = manifest["files"]
+    new = []
+    for path in sorted(BASE_DIR.rglob("*")):
+        if not path.is_file() or path.suffix in (".part", ".ytdl", ".tmp"):
+            continue
+        rel = path.relative_to(BASE_DIR).as_posix()
+        st  = path.stat()
+        if st.st_size == 0:
+            continue
+        entry = known.get(rel)
+        if entry and entry["size"] == st.st_size and entry["mtime"] == int(st.st_mtime):
+            continue
+        new.append((path, rel, st))
+    return new
+
+def export_archive() -> dict:
+    """
+    Appends every new or changed file in scraper_output/ to fresh tar segments
+    in scraper_export/ and records its segment + byte offset in manifest.json.
+    Existing segments are never rewritten, so each run costs only the new data.
+    A file's bytes can be read straight from its segment at [offset, offset+size).
+    """
+    print("\n  [Export]")
+    EXPORT_DIR.mkdir(parents=True, exist_ok=True)
+    manifest = load_manifest()
+    new = find_new_files(manifest)
+    if not new:
+        # Still write an (empty) manifest on the first run so sync has one to upload
+        if not MANIFEST_FILE.exists():
+            save_manifest(manifest)
+        print("    [=] Nothing new to export")
+        return manifest
+
+    limit   = SEGMENT_MAX_MB * 1024 * 1024
+    next_no = len(manifest["segments"]) + 1
+    pending = list(new)
+    while pending:
+        tmp  = EXPORT_DIR / f"segment_{next_no:05d}.tar.tmp"
+        entries = {}
+        with tarfile.open(tmp, "w", format=tarfile.PAX_FORMAT) as tar:
+            while pending:
+                path, rel, st = pending[0]
+                info   = tar.gettarinfo(str(path), arcname=rel)
+                header = len(info.tobuf(tar.format, tar.encoding, tar.errors))
+                padded = -(-info.size // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE
+                # Final size if this file is the last one: header + data, then the
+                # two end-of-archive blocks, rounded up to a whole tar record
+                end  = tar.fileobj.tell() + header + padded + 2 * tarfile.BLOCKSIZE
+                size = -(-end // tarfile.RECORDSIZE) * tarfile.RECORDSIZE
+                # Always put at least one file in a segment, even if it is huge
+                if entries and size > limit:
+                    break
+                pending.pop(0)
+                with open(path, "rb") as f:
+                    tar.addfile(info, f)
+                # Data sits right before the current position, padded to a block
+                entries[rel] = {
+                    "offset":  tar.fileobj.tell() - padded,
+                    "size":    info.size,
+                    "mtime":   int(st.st_mtime),
+                }
+        # The hash is part of the name, so a segment name (locally or in the
+        # bucket) can never point at different bytes than the manifest expects
+        sha256   = file_sha256(tmp)
+        name     = f"segment_{next_no:05d}-{sha256[:8]}.tar"
+        seg_path = EXPORT_DIR / name
+        os.replace(tmp, seg_path)
+        for entry in entries.values():
+            entry["segment"] = name
+
+        manifest["segments"].append({
+            "name":   name,
+            "size":   seg_path.stat().st_size,
+            "sha256": sha256,
+            "files":  len(entries),
+            "created": datetime.now().isoformat(timespec="seconds"),
+        })
+        manifest["files"].update(entries)
+        save_manifest(manifest)
+        size_mb = seg_path.stat().st_size / (1024 * 1024)
+        print(f"    [+] {name}  ({len(entries)} files, {size_mb:.1f} MB)")
+        next_no += 1
+
+    print(f"    {len(new)} files exported to: {EXPORT_DIR.resolve()}")
+    return manifest
+
+
+# ─── SYNC: upload new segments to S3-compatible storage (e.g. MinIO) ──────────
+def get_s3_client():
+    """Credentials come from the usual AWS_ACCESS_KEY_ID / AWS_SECRET_ACCESS_KEY env vars."""
+    try:
+        import boto3
+    except ImportError:
+        # Normally installed by install.bat / install_mac.sh
+        try:
+            subprocess.run([sys.executable, "-m", "pip", "install", "boto3", "--quiet"], check=True)
+            importlib.invalidate_caches()
+            import boto3
+        except Exception as e:
+            print(f"    [!!] boto3 is not installed and could not be installed: {e}")
+            print("    [i]  Run the installer again, or: python3 -m pip install boto3")
+            return None
+    from botocore.config import Config
+    try:
+        # SYNC_WORKERS segments at once, each with SYNC_WORKERS multipart threads
+        return boto3.client("s3", endpoint_url=S3_ENDPOINT,
+                            config=Config(max_pool_connections=SYNC_WORKERS * SYNC_WORKERS))
+    except Exception as e:
+        print(f"    [!!] Cannot set up S3 client for {S3_ENDPOINT}: {e}")
+        print("    [i]  Check SCRAPER_S3_ENDPOINT, e.g. http://localhost:9000")
+        return None
+
+def sync_archive() -> bool:
+    """
+    Exports, then uploads only the segments the bucket does not have yet
+    (in parallel, multipart). The manifest goes up last so readers never
+    see an index that points at a segment which is not there.
+    """
+    manifest = export_archive()
+    print(f"\n  [Sync]  {S3_ENDPOINT}/{S3_BUCKET}/{S3_PREFIX}/")
+    s3 = get_s3_client()
+    if s3 is None:
+        return False
+    from boto3.s3.transfer import TransferConfig
+    from botocore.exceptions import ClientError
+
+    try:
+        s3.head_bucket(Bucket=S3_BUCKET)
+    except ClientError as e:
+        # Only a missing bucket is ours to fix; 403 etc. means bad credentials
+        if e.response.get("Error", {}).get("Code") not in ("404", "NoSuchBucket"):
+            print(f"    [!!] Cannot access bucket: {e}")
+            return False
+        try:
+            s3.create_bucket(Bucket=S3_BUCKET)
+            print(f"    [+] Created bucket {S3_BUCKET}")
+        except Exception as e:
+            print(f"    [!!] Cannot create bucket: {e}")
+            return False
+    except Exception as e:
+        print(f"    [!!] Cannot reach {S3_ENDPOINT}: {e}")
+        return False
+
+    remote = {}
+    try:
+        for page in s3.get_paginator("list_objects_v2").paginate(Bucket=S3_BUCKET, Prefix=f"{S3_PREFIX}/"):
+            for obj in page.get("Contents", []):
+                remote[obj["Key"]] = obj["Size"]
+    except Exception as e:
+        print(f"    [!!] Cannot list bucket: {e}")
+        return False
+
+    todo = [seg for seg in manifest["segments"]
+            if remote.get(f"{S3_PREFIX}/{seg['name']}") != seg["size"]]
+    if not todo:
+        print("    [=] Bucket already up to date")
+    else:
+        config = TransferConfig(multipart_threshold=64 * 1024 * 1024,
+                                multipart_chunksize=64 * 1024 * 1024,
+                                max_concurrency=SYNC_WORKERS)
+
+        def upload(seg):
+            s3.upload_file(str(EXPORT_DIR / seg["name"]), S3_BUCKET,
+                           f"{S3_PREFIX}/{seg['name']}", Config=config)
+            return seg
+
+        failed = 0
+        with ThreadPoolExecutor(max_workers=SYNC_WORKERS) as pool:
+            futures = [pool.submit(upload, seg) for seg in todo]
+            for fut in as_completed(futures):
+                try:
+                    seg = fut.result()
+                    print(f"    [↑] {seg['name']}  ({seg['size'] / (1024 * 1024):.1f} MB)")
+                except Exception as e:
+                    failed += 1
+                    print(f"    [!!] Upload failed: {e}")
+        if failed:
+            print(f"    [!!] {failed} segment(s) failed — manifest not updated, run sync again")
+            return False
+
+    try:
+        s3.upload_file(str(MANIFEST_FILE), S3_BUCKET, f"{S3_PREFIX}/manifest.json")
+    except Exception as e:
+        print(f"    [!!] manifest.json upload failed: {e} — run sync again")
+        return False
+    print(f"    [↑] manifest.json  ({len(todo)} new segment(s))")
+    return True
+
+
 # ─── MAIN ────────────────────────────────────────────────────────────────────
 async def main():
     print()
@@ -648,7 +871,14 @@ async def main():
 
 if __name__ == "__main__":
     # Support both interactive mode and command-line args
-    if len(sys.argv) > 1:
+    if len(sys.argv) > 1 and sys.argv[1].lower() in ("export", "sync"):
+        # python web_scraper.py export   → pack scraper_output into scraper_export
+        # python web_scraper.py sync     → export, then upload new segments to S3/MinIO
+        if sys.argv[1].lower() == "export":
+            export_archive()
+        else:
+            sys.exit(0 if sync_archive() else 1)
+    elif len(sys.argv) > 1:
         # Command line: python web_scraper.py GRWRHITECH INFY
         async def cli_main():
             async with async_playwright() as p: